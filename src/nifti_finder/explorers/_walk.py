@@ -0,0 +1,245 @@
+"""Low-level `os.scandir`-based traversal helpers for file explorers"""
+
+from __future__ import annotations
+
+__all__ = [
+    "parse_pattern",
+    "iter_matches",
+]
+
+import functools
+import os
+import re
+from collections import deque
+from typing import Callable, Iterator
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+def _translate_segment(segment: str) -> str:
+    """
+    Translate a single glob segment (no '/') into a regex fragment.
+
+    Unlike `fnmatch.translate`, wildcards never cross path separators:
+    '*' maps to '[^/]*' and '?' to '[^/]'.
+    """
+    res: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            # Collapse consecutive '*' within a segment
+            while i < n and segment[i] == "*":
+                i += 1
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                res.append("\\[")
+            else:
+                stuff = segment[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if stuff[0] == "!":
+                    stuff = "^" + stuff[1:]
+                elif stuff[0] == "^":
+                    stuff = "\\" + stuff
+                res.append(f"[{stuff}]")
+        else:
+            res.append(re.escape(c))
+    return "".join(res)
+
+
+@functools.lru_cache(maxsize=256)
+def _segment_matcher(segment: str) -> Callable[[str], re.Match[str] | None]:
+    return re.compile(_translate_segment(segment) + r"\Z").match
+
+
+@functools.lru_cache(maxsize=256)
+def _tail_matcher(parts: tuple[str, ...]) -> Callable[[str], re.Match[str] | None]:
+    """Compile trailing pattern segments into a single relative-path regex."""
+    res: list[str] = []
+    last = len(parts) - 1
+    for idx, seg in enumerate(parts):
+        if seg == "**":
+            # '(?s:.)' matches any character including newlines, which '.'
+            # alone would miss in filenames; it is also faster to match than
+            # the equivalent '[\s\S]'-style class.
+            res.append("(?s:.)*" if idx == last else "(?:[^/]+/)*")
+        elif idx == last:
+            res.append(_translate_segment(seg))
+        else:
+            res.append(_translate_segment(seg) + "/")
+    return re.compile("".join(res) + r"\Z").match
+
+
+def parse_pattern(pattern: str) -> tuple[str, ...]:
+    """
+    Split a glob pattern into path segments for `iter_matches`.
+
+    Follows `Path.rglob` semantics: the pattern may match at any depth, so an
+    implicit '**' segment is prepended. Consecutive '**' segments are
+    collapsed, as they are equivalent but would make the walk revisit
+    subtrees.
+    """
+    parts: list[str] = ["**"]
+    for seg in pattern.split("/"):
+        if seg and not (seg == "**" and parts[-1] == "**"):
+            parts.append(seg)
+    return tuple(parts)
+
+
+def _join_rel(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def _enter_dir(entry: os.DirEntry, follow: bool, seen: set | None) -> bool:
+    """
+    Decide whether to descend into a directory entry.
+
+    With `follow` unset, symlinked directories are skipped outright using the
+    cached entry type, at zero syscall cost. With `follow` set, symlinked
+    directories are entered at most once per `(st_dev, st_ino)` so symlink
+    loops cannot recurse forever.
+    """
+    if not follow:
+        return entry.is_dir(follow_symlinks=False)
+    if not entry.is_dir():
+        return False
+    if entry.is_symlink():
+        try:
+            st = entry.stat()
+        except OSError:
+            return False
+        key = (st.st_dev, st.st_ino)
+        if key in seen:  # type: ignore[operator]
+            return False
+        seen.add(key)  # type: ignore[union-attr]
+    return True
+
+
+def _walk_filter(
+    root: str,
+    rel: str,
+    offset: int,
+    match: Callable[[str], re.Match[str] | None],
+    follow: bool,
+    seen: set | None,
+) -> Iterator[str]:
+    """Walk the whole subtree once, yielding files whose tail path matches."""
+    stack: deque[str] = deque([rel])
+    while stack:
+        cur = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root, cur) if cur else root)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                entry_rel = _join_rel(cur, entry.name)
+                try:
+                    if _enter_dir(entry, follow, seen):
+                        stack.append(entry_rel)
+                    elif entry.is_file() and match(entry_rel[offset:]):
+                        yield entry_rel
+                except OSError:
+                    continue
+
+
+def iter_matches(
+    root: str,
+    parts: tuple[str, ...],
+    follow_symlinks: bool = False,
+) -> Iterator[str]:
+    """
+    Yield '/'-separated paths of all files under `root` matching `parts`,
+    relative to `root`.
+
+    Walks segment by segment: literal segments are resolved with a single
+    `isdir`/`isfile` check instead of a directory scan; wildcard segments scan
+    one directory level with `os.scandir`; '**' segments recurse. Directory
+    entries are classified via the cached `DirEntry` type info to avoid one
+    `stat()` per entry. Unreadable or vanished directories are silently
+    skipped, matching `Path.rglob` behavior.
+
+    Symlinked directories are skipped by default; with `follow_symlinks`,
+    they are followed with a cycle guard (see `_enter_dir`). Symlinks to
+    regular files always match, as with `Path.rglob`, and literal segments
+    are resolved by the OS and thus always follow symlinks.
+    """
+    seen: set | None = set() if follow_symlinks else None
+    yield from _walk(root, "", parts, 0, follow_symlinks, seen)
+
+
+def _walk(
+    root: str,
+    rel: str,
+    parts: tuple[str, ...],
+    idx: int,
+    follow: bool,
+    seen: set | None,
+) -> Iterator[str]:
+    seg = parts[idx]
+    last = idx == len(parts) - 1
+
+    if not (_WILDCARD_CHARS & set(seg)):
+        # Literal segment: one stat() instead of a directory scan
+        child_rel = _join_rel(rel, seg)
+        child = os.path.join(root, child_rel)
+        if last:
+            if os.path.isfile(child):
+                yield child_rel
+        elif os.path.isdir(child):
+            yield from _walk(root, child_rel, parts, idx + 1, follow, seen)
+        return
+
+    if seg == "**" and "**" in parts[idx + 1:]:
+        # Multiple '**' left: expanding them recursively would revisit the
+        # same subtrees once per split and yield duplicates. Walk the subtree
+        # once and filter candidates with a regex compiled from the tail.
+        match = _tail_matcher(parts[idx:])
+        offset = len(rel) + 1 if rel else 0
+        yield from _walk_filter(root, rel, offset, match, follow, seen)
+        return
+
+    if seg == "**" and not last:
+        # '**' matches zero segments: try the remainder at this level too
+        yield from _walk(root, rel, parts, idx + 1, follow, seen)
+
+    try:
+        it = os.scandir(os.path.join(root, rel) if rel else root)
+    except OSError:
+        return
+    with it:
+        if seg == "**":
+            for entry in it:
+                try:
+                    if _enter_dir(entry, follow, seen):
+                        yield from _walk(root, _join_rel(rel, entry.name), parts, idx,
+                                         follow, seen)
+                    elif last and entry.is_file():
+                        yield _join_rel(rel, entry.name)
+                except OSError:
+                    continue
+        else:
+            match = _segment_matcher(seg)
+            for entry in it:
+                if not match(entry.name):
+                    continue
+                try:
+                    if last:
+                        if entry.is_file():
+                            yield _join_rel(rel, entry.name)
+                    elif _enter_dir(entry, follow, seen):
+                        yield from _walk(root, _join_rel(rel, entry.name), parts, idx + 1,
+                                         follow, seen)
+                except OSError:
+                    continue
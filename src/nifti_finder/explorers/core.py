@@ -9,14 +9,18 @@ __all__ = [
     "NeuroExplorer",
 ]
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 from collections.abc import Sequence
 
 from nifti_finder.explorers.base import FileExplorer
 from nifti_finder.explorers.mixins import MaterializeMixin
+from nifti_finder.explorers._walk import parse_pattern, iter_matches, _segment_matcher
 from nifti_finder.filters import Filter, Logic, FilterableMixin
 from nifti_finder.utils import resolve_path, ensure_seq
+from nifti_finder.utils._prefetch import prefetched
 
 
 class BasicFileExplorer(FileExplorer):
@@ -43,12 +47,27 @@ class BasicFileExplorer(FileExplorer):
     ...     preprocess(path)
     ```
     """
-    def __init__(self, pattern: str | Sequence[str] = "*"):
+    def __init__(
+        self,
+        pattern: str | Sequence[str] = "*",
+        *,
+        follow_symlinks: bool = False,
+        prefetch: int = 0,
+    ):
         """
         Args:
             pattern (str | Sequence[str]): Filename pattern to match. Defaults to '*'; i.e., 'any'.
+            follow_symlinks (bool): Whether to follow symlinked directories. Defaults to False.
+                When True, each symlinked directory is visited at most once, so symlink
+                loops cannot make the scan revisit subtrees.
+            prefetch (int): When positive, traverse on a background thread that keeps
+                up to this many candidate paths queued ahead of filtering, overlapping
+                directory I/O with Python-level work. Defaults to 0; i.e., disabled.
         """
         self._patterns = ensure_seq(pattern)
+        self._parsed_patterns = [parse_pattern(p) for p in self._patterns]
+        self._follow_symlinks = follow_symlinks
+        self._prefetch = max(0, prefetch)
 
     def scan(self, root_dir: Path | str, /) -> Iterator[Path]:
         """
@@ -61,10 +80,23 @@ class BasicFileExplorer(FileExplorer):
         if not root.is_dir():
             raise NotADirectoryError(f"{root} is not a valid directory")
 
-        for pattern in self._patterns:
-            for path in root.rglob(pattern):
-                if path.is_file():
-                    yield path
+        candidates = self._iter_paths(str(root))
+        if self._prefetch:
+            candidates = prefetched(candidates, self._prefetch)
+        passes = self._passes
+        for full in candidates:
+            if passes(full):
+                yield Path(full)
+
+    def _iter_paths(self, root_str: str) -> Iterator[str]:
+        """Yield matching file paths as plain strings."""
+        for parts in self._parsed_patterns:
+            for rel in iter_matches(root_str, parts, self._follow_symlinks):
+                yield os.path.join(root_str, rel)
+
+    def _passes(self, path_str: str, /) -> bool:
+        """Hook for subclasses to screen candidate paths before `Path` construction."""
+        return True
 
 
 class TwoStageFileExplorer(FileExplorer):
@@ -104,16 +136,29 @@ class TwoStageFileExplorer(FileExplorer):
         self,
         stage_1_pattern: str | Sequence[str] = "*",
         stage_2_pattern: str | Sequence[str] = "*",
+        parallel: int = 1,
+        *,
+        follow_symlinks: bool = False,
     ):
         """
         Args:
-            stage_1_pattern (str | Sequence[str]): Pattern to match stage 1 directories. 
+            stage_1_pattern (str | Sequence[str]): Pattern to match stage 1 directories.
                 Defaults to '*'; i.e., 'any'.
-            stage_2_pattern (str | Sequence[str]): Pattern to match stage 2 files. 
+            stage_2_pattern (str | Sequence[str]): Pattern to match stage 2 files.
                 Defaults to '*'; i.e., 'any'.
+            parallel (int): Number of worker threads scanning stage 1 directories
+                concurrently. Defaults to 1; i.e., sequential. Traversal is
+                syscall-bound and releases the GIL, so a small pool helps on fast
+                storage. Results are yielded in stage 1 order either way.
+            follow_symlinks (bool): Whether to follow symlinked directories. Defaults to False.
+                When True, each symlinked directory is visited at most once, so symlink
+                loops cannot make the scan revisit subtrees.
         """
         self._stage_1_patterns = ensure_seq(stage_1_pattern)
         self._stage_2_patterns = ensure_seq(stage_2_pattern)
+        self._stage_2_parsed = [parse_pattern(p) for p in self._stage_2_patterns]
+        self._parallel = max(1, parallel)
+        self._follow_symlinks = follow_symlinks
 
     def scan(
         self,
@@ -136,22 +181,82 @@ class TwoStageFileExplorer(FileExplorer):
         if not root.is_dir():
             raise NotADirectoryError(f"{root} is not a valid directory")
 
-        stage_1_dirs = [p for ptrn in self._stage_1_patterns for p in root.glob(ptrn) if p.is_dir()]
+        stage_1_dirs = list(self._iter_stage_1(root))
 
-        if progress:
-            try:
-                from tqdm.auto import tqdm
-                it = tqdm(stage_1_dirs, total=len(stage_1_dirs), **tqdm_kw)
-            except ImportError:
-                it = stage_1_dirs
-        else:
-            it = stage_1_dirs
+        if self._parallel > 1:
+            with ThreadPoolExecutor(max_workers=self._parallel) as pool:
+                results = pool.map(self._scan_stage_2, stage_1_dirs)
+                for paths in self._wrap_progress(results, len(stage_1_dirs),
+                                                 progress, **tqdm_kw):
+                    yield from paths
+            return
 
+        it = self._wrap_progress(stage_1_dirs, len(stage_1_dirs), progress, **tqdm_kw)
+        passes = self._passes
         for subj in it:
-            for ptrn in self._stage_2_patterns:
-                for path in subj.rglob(ptrn):
-                    if path.is_file():
-                        yield path
+            for full in self._iter_stage_2(str(subj)):
+                if passes(full):
+                    yield Path(full)
+
+    def _iter_stage_1(self, root: Path) -> Iterator[Path]:
+        """Yield stage 1 directories, scanning `root` once per pattern."""
+        root_str = str(root)
+        for ptrn in self._stage_1_patterns:
+            if "/" in ptrn or "**" in ptrn:
+                # Multi-level pattern; defer to glob
+                yield from (p for p in root.glob(ptrn) if p.is_dir())
+                continue
+            match = _segment_matcher(ptrn)
+            try:
+                it = os.scandir(root_str)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    # Symlinked stage-1 dirs always count, matching the glob
+                    # fallback above and baseline glob()+is_dir();
+                    # `follow_symlinks` only governs recursive descent.
+                    if match(entry.name) and entry.is_dir():
+                        yield Path(entry.path)
+
+    def _iter_stage_2(self, subj_str: str) -> Iterator[str]:
+        """Yield matching stage 2 file paths as plain strings."""
+        for parts in self._stage_2_parsed:
+            for rel in iter_matches(subj_str, parts, self._follow_symlinks):
+                yield os.path.join(subj_str, rel)
+
+    def _scan_stage_2(self, subj: Path) -> list[Path]:
+        passes = self._passes
+        return [Path(full) for full in self._iter_stage_2(str(subj)) if passes(full)]
+
+    def _passes(self, path_str: str, /) -> bool:
+        """Hook for subclasses to screen candidate paths before `Path` construction."""
+        return True
+
+    #: Progress bar updates are batched to amortize tqdm's formatting cost
+    #: when individual stage 1 directories scan quickly.
+    _PROGRESS_BATCH = 32
+
+    @classmethod
+    def _wrap_progress(cls, iterable, total: int, progress: bool, **tqdm_kw):
+        if not progress:
+            yield from iterable
+            return
+        try:
+            from tqdm.auto import tqdm
+        except ImportError:
+            yield from iterable
+            return
+        with tqdm(total=total, **tqdm_kw) as pbar:
+            pending = 0
+            for item in iterable:
+                yield item
+                pending += 1
+                if pending == cls._PROGRESS_BATCH:
+                    pbar.update(pending)
+                    pending = 0
+            if pending:
+                pbar.update(pending)
 
 
 class AllPurposeFileExplorer(BasicFileExplorer, FilterableMixin, MaterializeMixin):
@@ -214,14 +319,19 @@ class AllPurposeFileExplorer(BasicFileExplorer, FilterableMixin, MaterializeMixi
         *,
         filters: Filter | Sequence[Filter] | None = None,
         logic: Logic | str = Logic.AND,
+        follow_symlinks: bool = False,
+        prefetch: int = 0,
     ):
         """
         Args:
             pattern (str | Sequence[str]): Filename pattern to match. Defaults to '*'; i.e., 'any'.
             filters (Filter | Sequence[Filter], optional): Filters to apply. Defaults to None.
             logic (Logic | str): Logic to apply to the filters. Defaults to 'AND'.
+            follow_symlinks (bool): Whether to follow symlinked directories. Defaults to False.
+            prefetch (int): When positive, keep up to this many candidate paths queued
+                ahead of filtering on a background thread. Defaults to 0; i.e., disabled.
         """
-        super().__init__(pattern=pattern)
+        super().__init__(pattern=pattern, follow_symlinks=follow_symlinks, prefetch=prefetch)
         FilterableMixin.__init__(self, filters=filters, logic=logic)
 
     def scan(self, root_dir: Path | str, /) -> Iterator[Path]:
@@ -231,9 +341,10 @@ class AllPurposeFileExplorer(BasicFileExplorer, FilterableMixin, MaterializeMixi
         Args:
             root_dir (Path | str): The root directory to scan.
         """
-        for path in super().scan(root_dir):
-            if self.apply_filters(path):
-                yield path
+        yield from super().scan(root_dir)
+
+    def _passes(self, path_str: str, /) -> bool:
+        return self._apply(path_str)
 
 
 class NeuroExplorer(TwoStageFileExplorer, FilterableMixin, MaterializeMixin):
@@ -304,6 +415,8 @@ class NeuroExplorer(TwoStageFileExplorer, FilterableMixin, MaterializeMixin):
         *,
         filters: Filter | Sequence[Filter] | None = None,
         logic: Logic | str = Logic.AND,
+        parallel: int = 1,
+        follow_symlinks: bool = False,
     ):
         """
         Args:
@@ -320,12 +433,20 @@ class NeuroExplorer(TwoStageFileExplorer, FilterableMixin, MaterializeMixin):
             filters (Filter | Sequence[Filter], optional): Filters to refine the 
                 discovered paths. Defaults to None.  
 
-            logic (Logic | str): Logical operator to combine multiple filters. 
-                Defaults to `"AND"`.  
+            logic (Logic | str): Logical operator to combine multiple filters.
+                Defaults to `"AND"`.
+
+            parallel (int): Number of worker threads scanning outer matches
+                concurrently. Defaults to 1; i.e., sequential.
+
+            follow_symlinks (bool): Whether to follow symlinked directories.
+                Defaults to False.
         """
         super().__init__(
             stage_1_pattern=outer,
             stage_2_pattern=inner,
+            parallel=parallel,
+            follow_symlinks=follow_symlinks,
         )
         FilterableMixin.__init__(self, filters=filters, logic=logic)
 
@@ -346,6 +467,7 @@ class NeuroExplorer(TwoStageFileExplorer, FilterableMixin, MaterializeMixin):
             **tqdm_kw: Additional keyword arguments to pass to `tqdm`. Most common
                 are `total`, and `desc`.
         """
-        for path in super().scan(root_dir, progress=progress, **tqdm_kw):
-            if self.apply_filters(path):
-                yield path
\ No newline at end of file
+        yield from super().scan(root_dir, progress=progress, **tqdm_kw)
+
+    def _passes(self, path_str: str, /) -> bool:
+        return self._apply(path_str)
\ No newline at end of file
@@ -7,6 +7,7 @@ __all__ = [
     "MaterializeMixin",
 ]
 
+from itertools import islice
 from typing import Protocol, Iterator, TYPE_CHECKING, runtime_checkable
 
 from nifti_finder.utils import resolve_path
@@ -48,14 +49,9 @@ class MaterializeMixin:
         """
         root = resolve_path(root_dir)
         it = self.scan(root, **scan_kw)  # type: ignore[attr-defined]
-        items: list[Path] = []
-        for p in it:
-            items.append(p)
-            if limit is not None and len(items) >= limit:
-                break
+        items: list[Path] = list(it) if limit is None else list(islice(it, limit))
         if unique:
-            seen: set[Path] = set()
-            items = [p for p in items if not (p in seen or seen.add(p))]
+            items = list(dict.fromkeys(items))
         if sort:
             items.sort()
         return items
@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
 
@@ -21,8 +22,27 @@ class Logic(str, Enum):
 
 class Filter(ABC):
     """Interface for any filepath filter"""
+
+    # Keep the hierarchy dict-free: subclasses are slotted dataclasses, and a
+    # non-slotted base would silently give every instance a __dict__ back
+    __slots__ = ()
+
+    #: Relative evaluation cost, used to order short-circuit chains so cheap
+    #: predicates run first: 0 = name string test, 1 = regex, 2 = directory
+    #: components, 3 = filesystem access. Purely advisory.
+    _cost: int = 1
+
     @abstractmethod
     def __call__(self, filepath: Path | str, /) -> bool: ...
 
     def filter(self, filepath: Path | str, /) -> bool:
-        return self(filepath)
\ No newline at end of file
+        return self(filepath)
+
+    def apply_batch(self, filepaths: Sequence[Path | str], /) -> list[bool]:
+        """
+        Apply the filter to many filepaths at once, returning one bool per path.
+
+        The default is a list comprehension over `__call__`; subclasses can
+        override to hoist per-call setup out of the loop.
+        """
+        return [self(fp) for fp in filepaths]
\ No newline at end of file
@@ -9,8 +9,62 @@ __all__ = [
 from collections.abc import Sequence
 from pathlib import Path
 from dataclasses import dataclass, field
+import os
+import re
 
 from nifti_finder.filters.base import Filter, Logic
+from nifti_finder.filters.unit import (
+    IncludeExtension,
+    IncludeFilePrefix,
+    IncludeFileSuffix,
+    IncludeFileRegex,
+    ExcludeExtension,
+    ExcludeFilePrefix,
+    ExcludeFileSuffix,
+    ExcludeFileRegex,
+)
+
+_NEGATED_TYPES = (ExcludeExtension, ExcludeFilePrefix, ExcludeFileSuffix,
+                  ExcludeFileRegex)
+
+#: Compositions larger than this fall back to the generator-based evaluation;
+#: the per-call win of an unrolled chain no longer justifies the code size.
+_CODEGEN_MAX = 16
+
+
+def _name_fragment(flt: Filter) -> str | None:
+    """
+    Translate a filename-based unit filter into a zero-width regex assertion
+    anchored at the start of the filename, or None if the filter cannot be
+    expressed as one.
+    """
+    t = type(flt)
+    if t in (IncludeExtension, ExcludeExtension):
+        # Full suffix-chain semantics: non-empty, dot-free stem, ignoring
+        # leading dots as `Path.suffixes` does for hidden files
+        source = rf"\.*[^.]+{re.escape(flt.extension)}\Z"
+    elif t in (IncludeFilePrefix, ExcludeFilePrefix):
+        source = re.escape(flt.prefix)
+    elif t in (IncludeFileSuffix, ExcludeFileSuffix):
+        if "." in flt.suffix:
+            return None
+        # The suffix must close the extension-free part of the name; leading
+        # dots cover hidden files, whose leading dots never start an
+        # extension. Names ending in a bare dot have no extension at all
+        # (the whole name is the stem), so they can never end in a dot-free
+        # suffix — the leading lookahead rules them out.
+        source = rf"(?![\s\S]*\.\Z)\.*[^.]*{re.escape(flt.suffix)}(?:\.|\Z)"
+    elif t in (IncludeFileRegex, ExcludeFileRegex):
+        # Group constructs are not embeddable: fusion renumbers groups, which
+        # silently breaks numbered backreferences, and a global inline flag
+        # like '(?i)' is a compile error mid-expression. Backreferences
+        # without their group are equally unsafe, so refuse both.
+        if re.search(r"\(|\\\d", flt.regex):
+            return None
+        source = rf"(?:{flt.regex})"
+    else:
+        return None
+    return f"(?!{source})" if t in _NEGATED_TYPES else f"(?={source})"
 
 
 @dataclass(frozen=True, slots=True, init=False)
@@ -31,7 +85,10 @@ class ComposeFilter(Filter):
     """
     filters: tuple[Filter, ...] = field()
     logic: Logic = field()
-    
+    _fast: object = field(init=False, repr=False, compare=False)
+    _chain: object = field(init=False, repr=False, compare=False)
+
+
     def __init__(
         self, 
         filters: Filter | Sequence[Filter],
@@ -56,9 +113,119 @@ class ComposeFilter(Filter):
         elif not isinstance(logic, Logic):
             raise TypeError(f"logic must be Logic or str, got {type(logic).__name__}")
 
+        # Splice same-logic compose children in place so the tree is minimal
+        # by construction; children flattened themselves the same way, so one
+        # level of splicing is complete.
+        if any(isinstance(flt, ComposeFilter) and flt.logic is logic for flt in filters):
+            filters = tuple(
+                sub
+                for flt in filters
+                for sub in (flt.filters
+                            if isinstance(flt, ComposeFilter) and flt.logic is logic
+                            else (flt,))
+            )
+
         object.__setattr__(self, "filters", filters)
         object.__setattr__(self, "logic", logic)
 
+        fused = self._fuse_source()
+        object.__setattr__(self, "_fast", re.compile(fused).match if fused else None)
+        object.__setattr__(self, "_chain", None if fused else self._compile_chain())
+
+    def _compile_chain(self):
+        """
+        Generate a straight-line `f0(p) and f1(p) and ...` evaluator for the
+        composition, binding each child as a default-free global. Removes the
+        generator and `all`/`any` dispatch overhead from the hot path while
+        keeping short-circuit semantics. Oversized compositions get a plain
+        short-circuiting loop over prebound child calls instead; returns None
+        only when the composition is empty.
+        """
+        if not self.filters:
+            return None
+        # Drop value-equal duplicates — the filters hash by value and are
+        # pure, so re-running one is wasted work under either logic. This and
+        # the cost sort below are evaluation-plan concerns only;
+        # `self.filters` keeps insertion order and duplicates for equality
+        # and repr. User-defined Filter subclasses need not be hashable
+        # (e.g. a non-frozen dataclass), so fall back to the list as-is.
+        try:
+            children: list = list(dict.fromkeys(self.filters))
+        except TypeError:
+            children = list(self.filters)
+        children = self._fuse_subset(children)
+        # Evaluate cheap predicates first so short-circuiting skips expensive
+        # ones (directory scans, filesystem probes) whenever possible
+        ordered = sorted(children, key=lambda flt: flt._cost)
+        if len(ordered) > _CODEGEN_MAX:
+            calls = tuple(flt.__call__ for flt in ordered)
+            if self.logic is Logic.AND:
+                def _apply(filepath, /):
+                    for call in calls:
+                        if not call(filepath):
+                            return False
+                    return True
+            else:
+                def _apply(filepath, /):
+                    for call in calls:
+                        if call(filepath):
+                            return True
+                    return False
+            return _apply
+        op = " and " if self.logic is Logic.AND else " or "
+        calls = op.join(f"_f{i}(filepath)" for i in range(len(ordered)))
+        ns = {f"_f{i}": flt for i, flt in enumerate(ordered)}
+        exec(compile(f"def _apply(filepath, /):\n    return {calls}", "<compose>", "exec"), ns)
+        return ns["_apply"]
+
+    def _fuse_subset(self, children: list) -> list:
+        """
+        Collapse the filename-expressible children of a mixed composition
+        into one compiled matcher, leaving the rest to run as calls. Turns N
+        regex walks per path into one; a no-op unless at least two children
+        fuse (the fully-fusable case is handled by `_fast` upstream).
+        """
+        frags: list[str] = []
+        rest: list = []
+        for flt in children:
+            frag = flt._fuse_source() if isinstance(flt, ComposeFilter) else _name_fragment(flt)
+            if frag is None:
+                rest.append(flt)
+            else:
+                frags.append(frag)
+        if len(frags) < 2 or not rest:
+            return children
+        joined = "".join(frags) if self.logic is Logic.AND else "|".join(frags)
+        matcher = re.compile(joined).match
+        basename, fspath = os.path.basename, os.fspath
+
+        def _fused(filepath, /):
+            return matcher(basename(fspath(filepath))) is not None
+
+        _fused._cost = 1
+        return [_fused, *rest]
+
+    def _fuse_source(self) -> str | None:
+        """
+        Fuse the composition into a single regex over the filename, when every
+        child is a filename-based predicate. Returns None otherwise.
+        """
+        frags: list[str] = []
+        for flt in self.filters:
+            frag = flt._fuse_source() if isinstance(flt, ComposeFilter) else _name_fragment(flt)
+            if frag is None:
+                return None
+            frags.append(frag)
+        if not frags:
+            return None
+        if self.logic is Logic.AND:
+            return "(?:" + "".join(frags) + ")"
+        return "(?:" + "|".join(frags) + ")"
+
+    @property
+    def _cost(self) -> int:  # type: ignore[override]
+        return max((flt._cost for flt in self.filters), default=0)
+
     @property
     def _op(self):
         return all if self.logic is Logic.AND else any
@@ -74,22 +241,41 @@ class ComposeFilter(Filter):
         Args:
             filepath (Path): The filepath to apply the filters to.
         """
+        # Convert to str once; every unit filter re-derives name/dirname from
+        # strings, so children never repeat the Path-to-str conversion
+        path_str = os.fspath(filepath)
+        if self._fast is not None:
+            return self._fast(os.path.basename(path_str)) is not None
+        if self._chain is not None:
+            return self._chain(path_str)
         if not self.filters:
             return self._identity
-        return self._op(flt(filepath) for flt in self.filters)
+        return self._op(flt(path_str) for flt in self.filters)
     
+    def apply_batch(self, filepaths: Sequence[Path | str], /) -> list[bool]:
+        """
+        Apply the composition to many filepaths at once.
+
+        Binds the fused matcher (or generated chain) locally so the per-path
+        work is a single C-level call inside one list comprehension.
+        """
+        fspath = os.fspath
+        if self._fast is not None:
+            fast, basename = self._fast, os.path.basename
+            return [fast(basename(fspath(fp))) is not None for fp in filepaths]
+        if self._chain is not None:
+            chain = self._chain
+            return [chain(fspath(fp)) for fp in filepaths]
+        return [self(fp) for fp in filepaths]
+
     def flatten(self) -> ComposeFilter:
-        """Return a new ComposeFilter with one-level, same-logic children flattened."""
-        flat: list[Filter] = []
-        stack: list[Filter] = list(self.filters)
-        while stack:
-            f = stack.pop()
-            if isinstance(f, ComposeFilter) and f.logic is self.logic:
-                stack.extend(f.filters)
-            else:
-                flat.append(f)
-        flat.reverse()
-        return ComposeFilter(flat, self.logic)
-    
+        """
+        Return the composition with same-logic children flattened.
+
+        Flattening now happens at construction, so this simply returns `self`;
+        kept for backwards compatibility.
+        """
+        return self
+
     def __len__(self) -> int:
-        return len(self.flatten().filters)
\ No newline at end of file
+        return len(self.filters)
\ No newline at end of file
@@ -49,7 +49,7 @@ class FilterableMixin:
     True
     ```
     """
-    __slots__ = ("_filters", "_logic", "_composed")
+    __slots__ = ("_filters", "_logic", "_composed", "_apply")
 
     def __init__(
         self, 
@@ -108,7 +108,8 @@ class FilterableMixin:
         self._rebuild_composed()
 
     def apply_filters(self, filepath: Path | str, /) -> bool:
-        return self._composed(filepath)
+        return self._apply(filepath)
 
     def _rebuild_composed(self) -> None:
-        self._composed = ComposeFilter(self._filters, self._logic)
\ No newline at end of file
+        self._composed = ComposeFilter(self._filters, self._logic).flatten()
+        self._apply = self._composed.__call__
\ No newline at end of file
@@ -22,13 +22,71 @@ __all__ = [
 ]
 
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import fnmatch
+import functools
+import os
 import re
+import sys
 
 from nifti_finder.filters.base import Filter
 from nifti_finder.utils import get_ext, resolve_path
 
 
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+def _maybe_resolve(path: Path | str) -> Path:
+    """
+    Cheap stand-in for `resolve_path` on candidate files: absolute paths
+    without '..' are used as-is, skipping the symlink walk (one or more
+    syscalls) that `Path.resolve` performs per call.
+    """
+    p = Path(path)
+    if p.is_absolute() and ".." not in p.parts:
+        return p
+    return resolve_path(p)
+
+
+def _dir_parts(filepath: Path | str) -> list[str]:
+    """Directory components of a path as plain strings, no Path allocations."""
+    return os.path.dirname(os.fspath(filepath)).split(os.sep)
+
+
+def _trivial_matcher(regex: str):
+    """
+    Map a trivially-structured pattern to a plain string predicate, or None.
+
+    Patterns of the shape `LIT`/`LIT.*` reduce to `str.startswith` and
+    `.*LIT`/`.*LIT.*` to the `in` operator under `re.match` semantics — both
+    single C calls with none of the regex engine's per-character dispatch.
+    A trailing `c*` makes its literal char optional, so it is dropped from
+    the literal before reduction.
+    """
+    m = re.fullmatch(r"(\.\*)?([A-Za-z0-9_\- ]+)(\*|\.\*)?", regex)
+    if m is None:
+        return None
+    lead, lit, trail = m.groups()
+    if trail == "*":
+        lit = lit[:-1]
+        if not lit:
+            return None
+    lit = sys.intern(lit)
+    if lead:
+        return lambda name: lit in name
+    return lambda name: name.startswith(lit)
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_names_in(dir_str: str) -> tuple[str, ...]:
+    """List regular-file names in a directory, cached across calls."""
+    try:
+        with os.scandir(dir_str) as it:
+            return tuple(e.name for e in it if e.is_file())
+    except OSError:
+        return ()
+
+
 @dataclass(frozen=True, slots=True)
 class IncludeExtension(Filter):
     """
@@ -44,14 +102,24 @@ class IncludeExtension(Filter):
     Args:
         extension (str): Target file extension.
     """
+    _cost = 0
     extension: str
-    
+    _extlen: int = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        if not self.extension.startswith("."):
-            object.__setattr__(self, "extension", f".{self.extension}")
+        ext = self.extension if self.extension.startswith(".") else f".{self.extension}"
+        object.__setattr__(self, "extension", sys.intern(ext))
+        object.__setattr__(self, "_extlen", len(ext))
 
     def __call__(self, filepath: Path | str, /) -> bool:
-        return get_ext(filepath) == self.extension
+        name = os.path.basename(os.fspath(filepath))
+        if not name.endswith(self.extension):
+            return False
+        # Same semantics as get_ext(filepath) == self.extension: the target
+        # must be the full suffix chain, so the stem is non-empty and dot-free.
+        # Leading dots are ignored, as `Path.suffixes` does for hidden files.
+        stem = name[:-self._extlen].lstrip(".")
+        return bool(stem) and "." not in stem
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,11 +137,23 @@ class IncludeFileSuffix(Filter):
     Args:
         suffix (str): Target file suffix.
     """
+    _cost = 0
     suffix: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "suffix", sys.intern(self.suffix))
+
     def __call__(self, filepath: Path | str, /) -> bool:
-        name_only = Path(filepath).name.removesuffix(get_ext(filepath))
-        return name_only.endswith(self.suffix)
+        name = os.path.basename(os.fspath(filepath))
+        # Extension-free stem, matching get_ext semantics in one string scan:
+        # the extension starts at the first dot past all leading dots (which
+        # Path.suffixes strips, as for hidden files), and names ending in a
+        # bare dot have no extension at all.
+        stem_start = len(name) - len(name.lstrip("."))
+        i = name.find(".", stem_start)
+        if i > 0 and not name.endswith("."):
+            name = name[:i]
+        return name.endswith(self.suffix)
 
 
 @dataclass(frozen=True, slots=True)
@@ -91,10 +171,14 @@ class IncludeFilePrefix(Filter):
     Args:
         prefix (str): Target file prefix.
     """
+    _cost = 0
     prefix: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "prefix", sys.intern(self.prefix))
+
     def __call__(self, filepath: Path | str, /) -> bool:
-        return Path(filepath).name.startswith(self.prefix)
+        return os.path.basename(os.fspath(filepath)).startswith(self.prefix)
 
 
 @dataclass(frozen=True, slots=True)
@@ -112,9 +196,18 @@ class IncludeFileRegex(Filter):
         regex (str): Target file regex.
     """
     regex: str
+    _pattern: re.Pattern = field(init=False, repr=False, compare=False)
+    _match: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_pattern", re.compile(self.regex))
+        object.__setattr__(self, "_match", _trivial_matcher(self.regex))
 
     def __call__(self, filepath: Path | str, /) -> bool:
-        return re.match(self.regex, Path(filepath).name) is not None
+        name = os.path.basename(os.fspath(filepath))
+        if self._match is not None:
+            return self._match(name)
+        return self._pattern.match(name) is not None
 
 
 @dataclass(frozen=True, slots=True)
@@ -132,13 +225,11 @@ class IncludeDirectorySuffix(Filter):
     Args:
         suffix (str): Target directory suffix.
     """
+    _cost = 2
     suffix: str
 
     def __call__(self, filepath: Path | str, /) -> bool:
-        dirs = list(Path(filepath).parents)
-        if len(dirs) == 0:
-            return False
-        return any(d.name.endswith(self.suffix) for d in dirs)
+        return any(part.endswith(self.suffix) for part in _dir_parts(filepath))
 
 
 @dataclass(frozen=True, slots=True)
@@ -156,13 +247,11 @@ class IncludeDirectoryPrefix(Filter):
     Args:
         prefix (str): Target directory prefix.
     """
+    _cost = 2
     prefix: str
 
     def __call__(self, filepath: Path | str, /) -> bool:
-        dirs = list(Path(filepath).parents)
-        if len(dirs) == 0:
-            return False
-        return any(d.name.startswith(self.prefix) for d in dirs)
+        return any(part.startswith(self.prefix) for part in _dir_parts(filepath))
 
 
 @dataclass(frozen=True, slots=True)
@@ -179,13 +268,35 @@ class IncludeDirectoryRegex(Filter):
     Args:
         regex (str): Target directory regex.
     """
+    _cost = 2
     regex: str
+    _pattern: re.Pattern = field(init=False, repr=False, compare=False)
+    _per_ancestor: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_pattern", re.compile(self.regex))
+        # An end-anchored regex can match a shorter ancestor but not the
+        # parent, and a lookaround can likewise hold at an ancestor boundary
+        # but fail inside the longer parent path, so the single-match shortcut
+        # below is unsound for either. Conservative: a '$' inside a class or
+        # a '(?' starting a plain group also trigger the slower per-ancestor
+        # scan, which is always correct.
+        object.__setattr__(self, "_per_ancestor",
+                           "$" in self.regex or "\\Z" in self.regex
+                           or "(?" in self.regex)
 
     def __call__(self, filepath: Path | str, /) -> bool:
-        dirs = list(Path(filepath).parents)
-        if len(dirs) == 0:
-            return False
-        return any(re.match(self.regex, str(d)) is not None for d in dirs)
+        path_str = os.fspath(filepath)
+        if not self._per_ancestor and os.path.isabs(path_str):
+            # Every ancestor path is a prefix of the immediate parent's path,
+            # and `match` is anchored only at the start, so a match against
+            # any ancestor implies a match against the parent: one invocation
+            # suffices. Relative paths end their ancestor chain with the
+            # synthetic '.', which is not such a prefix, so they take the
+            # per-ancestor scan below.
+            return self._pattern.match(os.path.dirname(path_str)) is not None
+        match = self._pattern.match
+        return any(match(str(d)) is not None for d in Path(filepath).parents)
 
 
 @dataclass(frozen=True, slots=True)
@@ -243,35 +354,89 @@ class IncludeIfFileExists(Filter):
                 Otherwise the filter will keep silently failing and returning False.
     
     """
+    _cost = 3
     filename_pattern: str
     search_in: str = "--"
     mirror_relative_to: Path | str | None = None
+    _mode: int = field(init=False, repr=False, compare=False)
+    _search_root: Path | None = field(init=False, repr=False, compare=False)
+    _mirror_src: Path | None = field(init=False, repr=False, compare=False)
+    _name_match: object = field(init=False, repr=False, compare=False)
+    _literal: bool = field(init=False, repr=False, compare=False)
 
-    def __call__(self, filepath: Path | str, /) -> bool:
-        filepath = resolve_path(filepath)
+    # Search modes, parsed once at construction
+    _SAME_DIR, _MIRROR, _ABSOLUTE, _RELATIVE = range(4)
+
+    def __post_init__(self):
+        search_root = mirror_src = None
         if self.search_in == "--":
-            target_dir = filepath.parent
+            mode = self._SAME_DIR
         elif self.mirror_relative_to is not None:
-            mirror_root = resolve_path(self.search_in)
-            src_root = resolve_path(self.mirror_relative_to)
+            mode = self._MIRROR
+            search_root = resolve_path(self.search_in)
+            mirror_src = resolve_path(self.mirror_relative_to)
+        elif Path(self.search_in).is_absolute():
+            mode = self._ABSOLUTE
+            search_root = resolve_path(self.search_in)
+        else:
+            mode = self._RELATIVE
+            search_root = Path(self.search_in)
+        object.__setattr__(self, "_mode", mode)
+        object.__setattr__(self, "_search_root", search_root)
+        object.__setattr__(self, "_mirror_src", mirror_src)
+        # Fixed filename patterns compile to a regex once; '--' depends on the
+        # candidate file and slash-bearing patterns go through glob instead
+        name_match = None
+        if self.filename_pattern != "--" and "/" not in self.filename_pattern:
+            name_match = re.compile(fnmatch.translate(self.filename_pattern)).match
+        object.__setattr__(self, "_name_match", name_match)
+        # A fixed pattern without glob metacharacters names one exact file:
+        # a single stat() then beats listing the directory
+        literal = (self.filename_pattern != "--"
+                   and not _WILDCARD_CHARS & set(self.filename_pattern))
+        object.__setattr__(self, "_literal", literal)
+
+    def __call__(self, filepath: Path | str, /) -> bool:
+        filepath = _maybe_resolve(filepath)
+        mode = self._mode
+        if mode == self._SAME_DIR:
+            target_dir = filepath.parent
+        elif mode == self._MIRROR:
             try:
-                rel = filepath.parent.relative_to(src_root)
+                rel = filepath.parent.relative_to(self._mirror_src)
             except ValueError:
                 return False
-            target_dir = (mirror_root / rel)
+            target_dir = self._search_root / rel
+        elif mode == self._ABSOLUTE:
+            target_dir = self._search_root
         else:
-            p = Path(self.search_in)
-            target_dir = resolve_path(p) if p.is_absolute() else filepath.parent / p
+            target_dir = filepath.parent / self._search_root
+
+        if self._literal:
+            return os.path.isfile(os.path.join(str(target_dir), self.filename_pattern))
 
         pattern = filepath.name if self.filename_pattern == "--" else self.filename_pattern
 
-        try:
-            return any(p.is_file() for p in target_dir.glob(pattern))
-        except FileNotFoundError:
-            return False
+        if "/" in pattern:
+            # Pattern descends into subdirectories; defer to glob
+            try:
+                return any(p.is_file() for p in target_dir.glob(pattern))
+            except FileNotFoundError:
+                return False
+
+        names = _file_names_in(str(target_dir))
+        match = self._name_match
+        if match is not None:
+            return any(match(n) for n in names)
+        return any(fnmatch.fnmatchcase(n, pattern) for n in names)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cached directory listings (e.g., after files were added)."""
+        _file_names_in.cache_clear()
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeExtension(IncludeExtension):
     """
     Exclude files with a specific extension
@@ -282,10 +447,10 @@ class ExcludeExtension(IncludeExtension):
         extension (str): Target file extension.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeExtension.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeFileSuffix(IncludeFileSuffix):
     """
     Exclude files with a specific suffix
@@ -296,10 +461,10 @@ class ExcludeFileSuffix(IncludeFileSuffix):
         suffix (str): Target file suffix.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeFileSuffix.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeFilePrefix(IncludeFilePrefix):
     """
     Exclude files with a specific prefix
@@ -310,10 +475,10 @@ class ExcludeFilePrefix(IncludeFilePrefix):
         prefix (str): Target file prefix.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeFilePrefix.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeFileRegex(IncludeFileRegex):
     """
     Exclude files with a specific regex
@@ -324,10 +489,10 @@ class ExcludeFileRegex(IncludeFileRegex):
         regex (str): Target file regex.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeFileRegex.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeDirectorySuffix(IncludeDirectorySuffix):
     """
     Exclude directories with a specific suffix
@@ -338,10 +503,10 @@ class ExcludeDirectorySuffix(IncludeDirectorySuffix):
         suffix (str): Target directory suffix.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeDirectorySuffix.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeDirectoryPrefix(IncludeDirectoryPrefix):
     """
     Exclude directories with a specific prefix
@@ -352,10 +517,10 @@ class ExcludeDirectoryPrefix(IncludeDirectoryPrefix):
         prefix (str): Target directory prefix.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeDirectoryPrefix.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeDirectoryRegex(IncludeDirectoryRegex):
     """
     Exclude directories with a specific regex
@@ -366,10 +531,10 @@ class ExcludeDirectoryRegex(IncludeDirectoryRegex):
         regex (str): Target directory regex.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
+        return not IncludeDirectoryRegex.__call__(self, filepath)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, slots=True, init=False)
 class ExcludeIfFileExists(IncludeIfFileExists):
     """
     Exclude files if they are in the same directory as a specific file
@@ -380,4 +545,4 @@ class ExcludeIfFileExists(IncludeIfFileExists):
         filename_pattern (str): Target file pattern.
     """
     def __call__(self, filepath: Path | str, /) -> bool:
-        return not super().__call__(filepath)
\ No newline at end of file
+        return not IncludeIfFileExists.__call__(self, filepath)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Background-thread prefetching for I/O-bound iterators"""
+
+from __future__ import annotations
+
+__all__ = [
+    "prefetched",
+]
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    """Carries a producer-side exception across the queue."""
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def prefetched(iterable: Iterable[T], depth: int = 64) -> Iterator[T]:
+    """
+    Consume `iterable` on a background thread, re-yielding its items on the
+    caller's thread through a bounded queue.
+
+    Useful when production is syscall-bound (directory scans release the GIL)
+    and consumption does Python-level work: the filesystem fills the queue
+    while the current items are being processed. `depth` bounds how far the
+    producer may run ahead, capping memory. Producer-side exceptions are
+    re-raised at the consuming side; abandoning the iterator stops the
+    producer promptly.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _produce() -> None:
+        out = _DONE
+        try:
+            for item in iterable:
+                while not stop.is_set():
+                    try:
+                        q.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                else:
+                    return
+        except BaseException as exc:
+            out = _Failure(exc)
+        while not stop.is_set():
+            try:
+                q.put(out, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    worker = threading.Thread(target=_produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if type(item) is _Failure:
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
@@ -10,6 +10,13 @@ import warnings
 T = TypeVar("T")
 
 def ensure_seq(obj: T | Sequence[T]) -> Sequence[T]:
+    # Concrete-type checks first: a single C-level comparison for the common
+    # cases, instead of the ABC registry walk isinstance(obj, Sequence) does
+    t = type(obj)
+    if t is str:
+        return cast(Sequence[T], [obj])
+    if t is list or t is tuple:
+        return cast(Sequence[T], obj)
     if isinstance(obj, str):
         return cast(Sequence[T], [obj])
     if isinstance(obj, Sequence):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import warnings
 
 import pytest
@@ -72,6 +73,52 @@ class TestBasicFileExplorer:
         assert len(paths) == 6
 
 
+class TestSymlinkTraversal:
+    """
+    Test symlink handling in `BasicFileExplorer`.
+
+    Tests:
+    A) Default: symlinked directories are skipped, but symlinks to regular
+        files are yielded, matching `Path.rglob` behavior.
+    B) `follow_symlinks`: a symlinked directory is entered exactly once.
+    C) `follow_symlinks`: a symlink loop terminates, yielding each path once.
+    """
+    @pytest.fixture()
+    def symlink_tree(self, tmp_path):
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "a.nii").touch()
+        try:
+            os.symlink(real, tmp_path / "link", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("platform does not support symlinks")
+        os.symlink(real / "a.nii", tmp_path / "b.nii")
+        return tmp_path
+
+    @staticmethod
+    def _rel_names(paths, root):
+        # scan() resolves its root, so resolve here too before relativizing
+        return sorted(p.relative_to(root.resolve()).as_posix() for p in paths)
+
+    def test_default_skips_symlinked_dirs(self, symlink_tree):
+        explorer = BasicFileExplorer(pattern="*.nii")
+        paths = explorer.scan(symlink_tree)
+        assert self._rel_names(paths, symlink_tree) == ["b.nii", "real/a.nii"]
+
+    def test_follow_enters_symlinked_dir_once(self, symlink_tree):
+        explorer = BasicFileExplorer(pattern="*.nii", follow_symlinks=True)
+        paths = explorer.scan(symlink_tree)
+        assert self._rel_names(paths, symlink_tree) == ["b.nii", "link/a.nii", "real/a.nii"]
+
+    def test_follow_terminates_on_loop(self, symlink_tree):
+        os.symlink(symlink_tree / "real", symlink_tree / "real" / "loop",
+                   target_is_directory=True)
+        explorer = BasicFileExplorer(pattern="*.nii", follow_symlinks=True)
+        names = self._rel_names(explorer.scan(symlink_tree), symlink_tree)
+        assert len(names) == len(set(names))
+        assert "real/a.nii" in names
+
+
 class TestTwoStageFileExplorer:
     """
     Test `TwoStageFileExplorer`
@@ -87,6 +134,7 @@ class TestTwoStageFileExplorer:
         as it is not a directory.
     E) Same as D, but with multiple patterns in stage 2 as well for .json files.
         Should be equivalent to the '*' pattern without the 'participants.tsv'.
+    F) Parallel stage-2 scanning: yields the same files as the serial path.
     """
     def test_all_nifti_files_bids(self, mock_datasets):
         explorer = TwoStageFileExplorer(stage_1_pattern="sub-*", 
@@ -129,12 +177,21 @@ class TestTwoStageFileExplorer:
         assert len(paths) == 5
     
     def test_multiple_patterns_stage_2(self, mock_datasets):
-        explorer = TwoStageFileExplorer(stage_1_pattern=["sub-*", "*.tsv"], 
+        explorer = TwoStageFileExplorer(stage_1_pattern=["sub-*", "*.tsv"],
                                         stage_2_pattern=["*.nii*", "*.json"])
         paths = explorer.scan(mock_datasets["bids_root"])
         paths = list(paths)
         assert len(paths) == 10
 
+    def test_parallel_matches_serial(self, mock_datasets):
+        serial = TwoStageFileExplorer(stage_1_pattern="sub-*",
+                                      stage_2_pattern="**/anat/*T1w.nii*")
+        parallel = TwoStageFileExplorer(stage_1_pattern="sub-*",
+                                        stage_2_pattern="**/anat/*T1w.nii*",
+                                        parallel=4)
+        assert (sorted(serial.scan(mock_datasets["bids_root"]))
+                == sorted(parallel.scan(mock_datasets["bids_root"])))
+
 
 class TestAllPurposeFileExplorer:
     """
@@ -196,6 +253,7 @@ class TestNeuroExplorer:
         without progress works as expected.
     D) Same as C, but check filtering compatibility by excluding 2 subjects
         that have a 'ses-*' directory. Also checks `remove_filters()` method.
+    E) Parallel scanning: yields the same files as the serial path.
     """
     def test_all_nifti_files(self, mock_datasets):
         explorer = NeuroExplorer()
@@ -245,10 +303,16 @@ class TestNeuroExplorer:
         paths = list(paths)
         assert len(paths) == 5
         assert all(
-            path.name.endswith(".nii") or path.name.endswith(".nii.gz") 
+            path.name.endswith(".nii") or path.name.endswith(".nii.gz")
             for path in paths
         )
 
+    def test_parallel_matches_serial(self, mock_datasets):
+        serial = NeuroExplorer(outer="OpenNeuro-ds*", inner="*.nii*")
+        parallel = NeuroExplorer(outer="OpenNeuro-ds*", inner="*.nii*", parallel=2)
+        assert (sorted(serial.scan(mock_datasets["multi_root"]))
+                == sorted(parallel.scan(mock_datasets["multi_root"])))
+
 
 # Backward compatibility
 class TestNiftiExplorer:
@@ -16,14 +16,17 @@ from tests.utils import assert_filter
 
 @pytest.fixture(autouse=True)
 def mock_iterdir(monkeypatch, file_paths):
+    # Index once by parent so each mocked iterdir is a dict lookup rather
+    # than a linear scan of file_paths
+    by_parent = {f.parent: [f.parent / "prefix_file6.nii.gz"] for f in file_paths}
+
     def _dummy_call(self, *args, **kwargs):
-        out_paths = []
-        for f in file_paths:
-            if f.parent == self:
-                out_paths.append(f.parent / "prefix_file6.nii.gz")
-        return out_paths
+        return by_parent.get(self, [])
     monkeypatch.setattr("pathlib.Path.iterdir", _dummy_call)
 
+def _an_invalid_filter(x): return x
+
+
 class TestComposeFilter:
     """Test compose filter"""
     def test_identity(self, file_paths):
@@ -83,23 +86,41 @@ class TestComposeFilter:
         assert_filter(filter_flatten_ref, file_paths, gnd_truth)
         assert_filter(filter_w_flatten, file_paths, gnd_truth)
 
-    def test_wrong_filters(self):
-        def _an_invalid_filter(x): return x
-        invalid_combs = [
-            _an_invalid_filter,
-            [IncludeExtension("nii.gz"), _an_invalid_filter],
-            5,
-            [IncludeExtension("nii.gz"), 5],
-            "NOT_VALID",
-            [IncludeExtension("nii.gz"), "NOT_VALID"],
-        ]
-        for comb in invalid_combs:
-            with pytest.raises(TypeError):
-                ComposeFilter(comb)
-    
-    def test_wrong_logic(self):
-        with pytest.raises(ValueError):
-            ComposeFilter([IncludeExtension("nii.gz")], logic="NOT_VALID")
+    def test_fused_suffix_ignores_leading_dots(self):
+        # The fused matcher must agree with the unit filter on hidden
+        # multi-leading-dot names
+        filter = ComposeFilter([IncludeFileSuffix("suffix"), IncludeExtension("nii")])
+        assert filter._fast is not None
+        assert filter("..file_suffix.nii")
+        assert not filter("..file_other.nii")
+
+    @pytest.mark.parametrize("filters, logic", [
+        pytest.param([], "AND", id="empty"),
+        pytest.param([IncludeExtension("nii.gz"), IncludeFilePrefix("file")], "AND", id="fused-and"),
+        pytest.param([IncludeExtension("nii.gz"), ExcludeFilePrefix("file")], "OR", id="fused-or"),
+        pytest.param([IncludeExtension("nii.gz"), IncludeDirectorySuffix("suffix")], "AND", id="chain"),
+    ])
+    def test_apply_batch_matches_call(self, filters, logic, file_paths):
+        filter = ComposeFilter(filters, logic=logic)
+        assert filter.apply_batch(file_paths) == [filter(f) for f in file_paths]
+
+    @pytest.mark.parametrize("comb", [
+        pytest.param(_an_invalid_filter, id="callable"),
+        pytest.param([IncludeExtension("nii.gz"), _an_invalid_filter], id="list-with-callable"),
+        pytest.param(5, id="int"),
+        pytest.param([IncludeExtension("nii.gz"), 5], id="list-with-int"),
+        pytest.param("NOT_VALID", id="str"),
+        pytest.param([IncludeExtension("nii.gz"), "NOT_VALID"], id="list-with-str"),
+    ])
+    def test_wrong_filters(self, comb):
         with pytest.raises(TypeError):
-            ComposeFilter([IncludeExtension("nii.gz")], logic=5) # type: ignore
+            ComposeFilter(comb)
+
+    @pytest.mark.parametrize("logic, error", [
+        pytest.param("NOT_VALID", ValueError, id="str"),
+        pytest.param(5, TypeError, id="int"),
+    ])
+    def test_wrong_logic(self, logic, error):
+        with pytest.raises(error):
+            ComposeFilter([IncludeExtension("nii.gz")], logic=logic)
         
\ No newline at end of file
@@ -9,108 +9,87 @@ from nifti_finder.filters import *
 from tests.utils import assert_filter
 
 
-class TestExtensionFilter:
-    """Test extension filter"""
-    def test_include_extension(self, file_paths):
-        filter = IncludeExtension("nii.gz")
-        assert_filter(filter, file_paths, [False, True, True, True, True, True, True])
-
-    def test_exclude_extension(self, file_paths):
-        filter = ExcludeExtension("txt")
-        assert_filter(filter, file_paths, [False, True, True, True, True, True, True])
-            
-            
-class TestSuffixFilter:
-    """Test suffix filter"""
-    def test_include_suffix_file(self, file_paths):
-        filter = IncludeFileSuffix("suffix")
-        assert_filter(filter, file_paths, [False, False, True, False, False, False, False])
-    
-    def test_exclude_suffix_file(self, file_paths):
-        filter = ExcludeFileSuffix("file0")
-        assert_filter(filter, file_paths, [False, True, True, True, True, True, True])
-
-    def test_include_suffix_dir(self, file_paths):
-        filter = IncludeDirectorySuffix("suffix")
-        assert_filter(filter, file_paths, [False, False, False, False, False, True, False])
-    
-    def test_exclude_suffix_dir(self, file_paths):
-        filter = ExcludeDirectorySuffix("data")
-        assert_filter(filter, file_paths, [False, False, False, False, False, True, False])
-            
-
-class TestPrefixFilter:
-    """Test prefix filter"""
-    def test_include_prefix(self, file_paths):
-        filter = IncludeFilePrefix("prefix")
-        assert_filter(filter, file_paths, [False, False, False, True, False, False, True])
-    
-    def test_exclude_prefix(self, file_paths):
-        filter = ExcludeFilePrefix("prefix_file6")
-        assert_filter(filter, file_paths, [True, True, True, True, True, True, False])
-    
-    def test_include_prefix_dir(self, file_paths):
-        filter = IncludeDirectoryPrefix("prefix")
-        assert_filter(filter, file_paths, [False, False, False, False, False, False, True])
-    
-    def test_exclude_prefix_dir(self, file_paths):
-        filter = ExcludeDirectoryPrefix("data")
-        assert_filter(filter, file_paths, [False, False, False, False, False, False, True])
-
-
-class TestRegexFilter:
-    """Test regex filter"""
-    def test_include_regex(self, file_paths):
-        filter = IncludeFileRegex(".*file*")
-        assert_filter(filter, file_paths, [True, True, True, True, True, True, True])
-    
-    def test_exclude_regex(self, file_paths):
-        filter = ExcludeFileRegex("prefix_.*")
-        assert_filter(filter, file_paths, [True, True, True, False, True, True, False])
-
-    def test_include_regex_dir(self, file_paths):
-        filter = IncludeDirectoryRegex(".*suffix*")
-        assert_filter(filter, file_paths, [False, False, False, False, False, True, False])
-    
-    def test_exclude_regex_dir(self, file_paths):
-        filter = ExcludeDirectoryRegex(".*data*")
-        assert_filter(filter, file_paths, [False, False, False, False, False, False, False])
+# One (filter, expected-mask) case per name-based filter over the shared
+# file_paths fixture. Each case is an independently schedulable test, so the
+# matrix load-balances cleanly under pytest-xdist (pytest -n auto).
+NAME_FILTER_CASES = [
+    pytest.param(IncludeExtension("nii.gz"), [False, True, True, True, True, True, True], id="include_extension"),
+    pytest.param(ExcludeExtension("txt"), [False, True, True, True, True, True, True], id="exclude_extension"),
+    pytest.param(IncludeFileSuffix("suffix"), [False, False, True, False, False, False, False], id="include_suffix_file"),
+    pytest.param(ExcludeFileSuffix("file0"), [False, True, True, True, True, True, True], id="exclude_suffix_file"),
+    pytest.param(IncludeDirectorySuffix("suffix"), [False, False, False, False, False, True, False], id="include_suffix_dir"),
+    pytest.param(ExcludeDirectorySuffix("data"), [False, False, False, False, False, True, False], id="exclude_suffix_dir"),
+    pytest.param(IncludeFilePrefix("prefix"), [False, False, False, True, False, False, True], id="include_prefix"),
+    pytest.param(ExcludeFilePrefix("prefix_file6"), [True, True, True, True, True, True, False], id="exclude_prefix"),
+    pytest.param(IncludeDirectoryPrefix("prefix"), [False, False, False, False, False, False, True], id="include_prefix_dir"),
+    pytest.param(ExcludeDirectoryPrefix("data"), [False, False, False, False, False, False, True], id="exclude_prefix_dir"),
+    pytest.param(IncludeFileRegex(".*file*"), [True, True, True, True, True, True, True], id="include_regex"),
+    pytest.param(ExcludeFileRegex("prefix_.*"), [True, True, True, False, True, True, False], id="exclude_regex"),
+    pytest.param(IncludeDirectoryRegex(".*suffix*"), [False, False, False, False, False, True, False], id="include_regex_dir"),
+    pytest.param(ExcludeDirectoryRegex(".*data*"), [False, False, False, False, False, False, False], id="exclude_regex_dir"),
+]
+
+
+@pytest.mark.parametrize("filter, expected", NAME_FILTER_CASES)
+def test_name_filters(filter, expected, file_paths):
+    assert_filter(filter, file_paths, expected)
+
+
+@pytest.mark.parametrize("filter, expected", NAME_FILTER_CASES)
+def test_apply_batch_matches_call(filter, expected, file_paths):
+    assert filter.apply_batch(file_paths) == [filter(f) for f in file_paths]
+
+
+def test_suffix_ignores_leading_dots():
+    # Path.suffixes strips all leading dots, so the extension of
+    # '..file_suffix.nii' is '.nii' and its stem is '..file_suffix'
+    assert IncludeFileSuffix("suffix")("..file_suffix.nii")
+    assert not IncludeFileSuffix("suffix")("..file_other.nii")
+    assert not ExcludeFileSuffix("suffix")("..file_suffix.nii")
+
+
+@pytest.fixture(scope="module")
+def fs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """
+    Create a tiny BIDS-like tree:
+
+    /data/sub-1/ses-1/t1.nii.gz
+    /data/sub-1/ses-1/other.json
+    /labels/sub-1/ses-1/t1_seg.nii.gz
+    /data/sub-2/ses-1/t1.nii.gz            (no label)
+
+    Module-scoped: the tests only read the tree, so it is built once
+    instead of once per test.
+    """
+    tmp_path = tmp_path_factory.mktemp("fs")
+    data = tmp_path / "data"
+    labels = tmp_path / "labels"
+
+    (data / "sub-1" / "ses-1").mkdir(parents=True)
+    (data / "sub-1" / "ses-1" / "labels").mkdir(parents=True)
+    (data / "sub-2" / "ses-1").mkdir(parents=True)
+    (labels / "sub-1" / "ses-1").mkdir(parents=True)
+    (labels / "sub-2" / "ses-1").mkdir(parents=True)
+
+    (data / "sub-1" / "ses-1" / "t1.nii.gz").touch()
+    (data / "sub-1" / "ses-1" / "other.json").touch()
+    (data / "sub-2" / "ses-1" / "t1.nii.gz").touch()
+    (data / "sub-1" / "ses-1" / "labels" / "t1_seg.nii.gz").touch()
+    (labels / "sub-2" / "ses-1" / "t1_seg.nii.gz").touch()
+
+    yield {
+        "data_root": data,
+        "labels_root": labels,
+        "t1_sub1": data / "sub-1" / "ses-1" / "t1.nii.gz",
+        "t1_sub2": data / "sub-2" / "ses-1" / "t1.nii.gz",
+    }
+    # The existence filters cache directory listings across calls; drop them
+    # so later tests never observe this (deleted) tree
+    IncludeIfFileExists.clear_cache()
 
 
 class TestIfFileExistsFilter:
     """Test if file exists filter"""
-    @pytest.fixture
-    def fs(self, tmp_path: Path) -> dict[str, Path]:
-        """
-        Create a tiny BIDS-like tree:
-
-        /data/sub-1/ses-1/t1.nii.gz
-        /data/sub-1/ses-1/other.json
-        /labels/sub-1/ses-1/t1_seg.nii.gz
-        /data/sub-2/ses-1/t1.nii.gz            (no label)
-        """
-        data = tmp_path / "data"
-        labels = tmp_path / "labels"
-
-        (data / "sub-1" / "ses-1").mkdir(parents=True)
-        (data / "sub-1" / "ses-1" / "labels").mkdir(parents=True)
-        (data / "sub-2" / "ses-1").mkdir(parents=True)
-        (labels / "sub-1" / "ses-1").mkdir(parents=True)
-        (labels / "sub-2" / "ses-1").mkdir(parents=True)
-
-        (data / "sub-1" / "ses-1" / "t1.nii.gz").touch()
-        (data / "sub-1" / "ses-1" / "other.json").touch()
-        (data / "sub-2" / "ses-1" / "t1.nii.gz").touch()
-        (data / "sub-1" / "ses-1" / "labels" / "t1_seg.nii.gz").touch()
-        (labels / "sub-2" / "ses-1" / "t1_seg.nii.gz").touch()
-
-        return {
-            "data_root": data,
-            "labels_root": labels,
-            "t1_sub1": data / "sub-1" / "ses-1" / "t1.nii.gz",
-            "t1_sub2": data / "sub-2" / "ses-1" / "t1.nii.gz",
-        }
-
     def test_no_op(self, fs):
         filter = IncludeIfFileExists(filename_pattern="--")
         assert_filter(filter, [fs["t1_sub1"], fs["t1_sub2"]], [True, True])
@@ -0,0 +1,56 @@
+"""Unit tests for utility helpers"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from nifti_finder.utils._prefetch import prefetched
+
+
+class TestPrefetched:
+    """
+    Test `prefetched`
+
+    Tests:
+    A) Normal drain: all items arrive, in order, across queue depths
+        (including depths smaller than the iterable).
+    B) Producer exception: re-raised on the consuming side after the
+        items produced before it.
+    C) Early abandonment: closing the iterator mid-stream stops the
+        producer thread instead of leaving it blocked on a full queue.
+    """
+    @pytest.mark.parametrize("depth", [1, 4, 64])
+    def test_drains_in_order(self, depth):
+        items = list(range(100))
+        assert list(prefetched(iter(items), depth)) == items
+
+    def test_reraises_producer_exception(self):
+        def produce():
+            yield 1
+            yield 2
+            raise OSError("scan failed")
+
+        it = prefetched(produce(), 4)
+        assert next(it) == 1
+        assert next(it) == 2
+        with pytest.raises(OSError, match="scan failed"):
+            next(it)
+
+    def test_abandonment_stops_producer(self):
+        done = threading.Event()
+
+        def produce():
+            try:
+                for i in range(10_000):
+                    yield i
+            finally:
+                done.set()
+
+        it = prefetched(produce(), 2)
+        assert next(it) == 0
+        it.close()
+        # The producer polls the stop flag every 0.1s while the queue is
+        # full; give it a little headroom beyond that
+        assert done.wait(timeout=2.0), "producer thread did not stop"
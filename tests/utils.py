@@ -8,7 +8,7 @@ from nifti_finder.filters import Filter
 
 
 def assert_filter(filter: Filter, file_paths: list[Path], expected: list[bool]):
-    outs = []
-    for f in file_paths:
-        outs.append(filter(f))
-    assert outs == expected
\ No newline at end of file
+    assert len(file_paths) == len(expected)
+    for i, (f, exp) in enumerate(zip(file_paths, expected)):
+        got = filter(f)
+        assert got == exp, f"filter({f}) == {got}, expected {exp} (index {i})"
\ No newline at end of file